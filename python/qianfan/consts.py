@@ -308,6 +308,10 @@ class DefaultValue:
     EnablePrivate: bool = False
     AccessCode: str = ""
     TruncatedContinuePrompt = "继续"
+    ResponseCacheSize: int = 128
+    ResponseCacheTTL: float = 600
+    HTTPConnectionPoolSize: int = 100
+    DNSCacheTTL: float = 300
     ImportStatusPollingInterval: float = 2
     ExportStatusPollingInterval: float = 2
     ReleaseStatusPollingInterval: float = 2
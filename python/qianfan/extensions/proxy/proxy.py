@@ -165,20 +165,20 @@ class ClientProxy(object):
                     self._sign(qf_req)
                 logging.debug(f"request: {qf_req}")
                 if qf_req.json_body.get("stream", False):
-                    resp, session = await self._client.arequest(qf_req)
+                    resp = await self._client.arequest(qf_req)
                     if (
                         "Content-Type" in resp.headers
                         and "application/json" in resp.headers["Content-Type"]
                     ):  # 判断返回中是否有流式数据
-                        resp, session = await self._client.arequest(qf_req)
-                        async with session:
+                        resp = await self._client.arequest(qf_req)
+                        async with resp:
                             json_body = await resp.json()
                         return json_body
                     else:
                         return self._client.arequest_stream(qf_req)
                 else:
-                    resp, session = await self._client.arequest(qf_req)
-                    async with session:
+                    resp = await self._client.arequest(qf_req)
+                    async with resp:
                         json_body = await resp.json()
                     return json_body
         except ClientDisconnect as e:
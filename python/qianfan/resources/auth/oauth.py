@@ -255,8 +255,8 @@ class AuthManager(metaclass=Singleton):
             if self._refresh_access_token_too_often(obj):
                 return
             try:
-                resp, session = await self._client.arequest(self._auth_request(ak, sk))
-                async with session:
+                resp = await self._client.arequest(self._auth_request(ak, sk))
+                async with resp:
                     json_body = await resp.json()
                 self._update_access_token(obj, json_body, ak, sk)
             except AuthError:
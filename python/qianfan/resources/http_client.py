@@ -12,15 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import weakref
 from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
 import aiohttp
 import requests
 
 from qianfan import get_config
+from qianfan.consts import DefaultValue
 from qianfan.resources.typing import QfRequest
 
 
+def _dispose_session(session: aiohttp.ClientSession) -> None:
+    """
+    best-effort close of a session which can no longer be awaited
+
+    detach the connector and close it directly so that pooled
+    connections are not leaked when the owning event loop is gone
+    """
+    if session.closed:
+        return
+    connector = session.connector
+    session.detach()
+    if connector is not None and not connector.closed:
+        closed = connector.close()
+        if asyncio.iscoroutine(closed):
+            # aiohttp versions where close() is a real coroutine
+            # cannot run it without the (dead) loop; abandon it
+            # silently instead of warning about an unawaited call
+            closed.close()
+
+
+def _dispose_remaining_sessions(
+    sync_session: requests.Session,
+    async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession],
+) -> None:
+    """
+    finalizer for HTTPClient: close every pooled session it still owns
+    """
+    sync_session.close()
+    while async_sessions:
+        _, session = async_sessions.popitem()
+        _dispose_session(session)
+
+
 class HTTPClient(object):
     """
     object used to make http request
@@ -43,6 +79,63 @@ class HTTPClient(object):
         else:
             self.ssl = True
         self._session = requests.session()
+        # enlarge the urllib3 pool (default 10) so concurrent callers
+        # reuse keep-alive connections instead of opening new sockets
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=DefaultValue.HTTPConnectionPoolSize,
+            pool_maxsize=DefaultValue.HTTPConnectionPoolSize,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = (
+            {}
+        )
+        # safety net: dispose whatever is left in the pools when the
+        # client is collected or the interpreter exits, so programs that
+        # never call close()/aclose() do not leak connections
+        self._finalizer = weakref.finalize(
+            self, _dispose_remaining_sessions, self._session, self._async_sessions
+        )
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        get the shared aiohttp session of the current event loop
+
+        sessions are keyed by event loop so that concurrent requests in
+        one loop reuse pooled keep-alive connections instead of paying a
+        TCP+TLS handshake per request
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            # drop sessions whose event loop has been closed
+            for dead_loop in [k for k in self._async_sessions if k.is_closed()]:
+                _dispose_session(self._async_sessions.pop(dead_loop))
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=DefaultValue.HTTPConnectionPoolSize,
+                    ttl_dns_cache=DefaultValue.DNSCacheTTL,
+                )
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    def close(self) -> None:
+        """
+        close the sync session and dispose all async sessions
+        """
+        self._finalizer()
+
+    async def aclose(self) -> None:
+        """
+        close the shared aiohttp session of the current event loop
+
+        await this before the event loop shuts down; sessions bound to
+        other loops are left to their own loops' cleanup
+        """
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
 
     def _requests_proxy(self) -> Optional[Dict[str, str]]:
         """
@@ -93,13 +186,11 @@ class HTTPClient(object):
         for line in resp.iter_lines():
             yield line, resp
 
-    async def arequest(
-        self, req: QfRequest
-    ) -> Tuple[aiohttp.ClientResponse, aiohttp.ClientSession]:
+    async def arequest(self, req: QfRequest) -> aiohttp.ClientResponse:
         """
         async request
         """
-        session = aiohttp.ClientSession()
+        session = self._get_async_session()
         timeout = aiohttp.ClientTimeout(total=req.retry_config.timeout)
         response = await session.request(
             **req.requests_args(),
@@ -107,7 +198,7 @@ class HTTPClient(object):
             ssl=self.ssl,
             proxy=self._aiohttp_proxy(),
         )
-        return response, session
+        return response
 
     async def arequest_stream(
         self, req: QfRequest
@@ -115,16 +206,16 @@ class HTTPClient(object):
         """
         async stream request
         """
-        async with aiohttp.ClientSession() as session:
-            timeout = aiohttp.ClientTimeout(total=req.retry_config.timeout)
-            async with session.request(
-                **req.requests_args(),
-                timeout=timeout,
-                ssl=self.ssl,
-                proxy=self._aiohttp_proxy(),
-            ) as resp:
-                # yield response first for checking meta info like status code
-                # without waiting for the whole response
-                yield bytes(), resp
-                async for line in resp.content:
-                    yield line, resp
+        session = self._get_async_session()
+        timeout = aiohttp.ClientTimeout(total=req.retry_config.timeout)
+        async with session.request(
+            **req.requests_args(),
+            timeout=timeout,
+            ssl=self.ssl,
+            proxy=self._aiohttp_proxy(),
+        ) as resp:
+            # yield response first for checking meta info like status code
+            # without waiting for the whole response
+            yield bytes(), resp
+            async for line in resp.content:
+                yield line, resp
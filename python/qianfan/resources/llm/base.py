@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-import copy
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
@@ -41,6 +40,7 @@ from qianfan import get_config
 from qianfan.consts import APIErrorCode, Consts, DefaultValue
 from qianfan.resources.console.service import Service
 from qianfan.resources.requestor.openapi_requestor import (
+    QfAPIRequestor,
     QfAPIV2Requestor,
     create_api_requestor,
 )
@@ -179,6 +179,20 @@ class VersionBase(object):
         """
         return self._real.access_token()
 
+    def close(self) -> None:
+        """
+        release the HTTP connections held by this resource
+        """
+        self._real.close()
+        self._backup.close()
+
+    async def aclose(self) -> None:
+        """
+        release the async HTTP connections of the current event loop
+        """
+        await self._real.aclose()
+        await self._backup.aclose()
+
     @utils.class_or_instancemethod
     def models(
         self_or_cls,
@@ -261,12 +275,26 @@ class VersionBase(object):
 
 
 class BaseResource(object):
+    _client: QfAPIRequestor
+
     def __init__(
         self,
         **kwargs: Any,
     ) -> None:
         pass
 
+    def close(self) -> None:
+        """
+        release the HTTP connections held by this resource
+        """
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """
+        release the async HTTP connections of the current event loop
+        """
+        await self._client.aclose()
+
     @classmethod
     def _default_model(cls) -> str:
         """
@@ -362,17 +390,18 @@ class BaseResource(object):
         """
         generate header
         """
-        kwargs = copy.deepcopy(kwargs)
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-        kwargs["headers"][Consts.XRequestID] = (
+        # only the headers dict is read and extended here, so a shallow
+        # copy of it avoids deep-copying the whole kwargs (which contains
+        # the full message history) on every request
+        headers = dict(kwargs.get("headers") or {})
+        headers[Consts.XRequestID] = (
             kwargs["request_id"]
             if kwargs.get("request_id")
             else (
                 f"{Consts.QianfanRequestIdDefaultPrefix}-{utils.generate_letter_num_random_id(16)}"
             )
         )
-        return kwargs["headers"]
+        return headers
 
     def _generate_query(
         self, model: Optional[str], stream: bool, **kwargs: Any
@@ -390,17 +419,20 @@ class BaseResource(object):
         """
         generate body
         """
-        kwargs = copy.deepcopy(kwargs)
+        # the body itself and the nested dicts written below are copied;
+        # everything else (e.g. the message list) is passed by reference,
+        # which spares a deep copy of the whole payload per request
+        kwargs = dict(kwargs)
         IGNORED_KEYS = {"headers", "query", "request_id"}
         for key in IGNORED_KEYS:
             if key in kwargs:
                 del kwargs[key]
 
         kwargs["stream"] = stream
-        if "extra_parameters" not in kwargs:
-            kwargs["extra_parameters"] = {}
-        if kwargs["extra_parameters"].get("request_source") is None:
-            kwargs["extra_parameters"]["request_source"] = f"qianfan_py_sdk_v{VERSION}"
+        extra_parameters = dict(kwargs.get("extra_parameters") or {})
+        if extra_parameters.get("request_source") is None:
+            extra_parameters["request_source"] = f"qianfan_py_sdk_v{VERSION}"
+        kwargs["extra_parameters"] = extra_parameters
         return kwargs
 
     def _data_postprocess(self, data: QfResponse) -> QfResponse:
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
-from functools import partial
+import hashlib
+import json
+import threading
+from functools import lru_cache, partial
 from typing import (
     Any,
     AsyncIterator,
@@ -25,6 +28,8 @@ from typing import (
     Union,
 )
 
+from cachetools import TTLCache
+
 import qianfan.errors as errors
 from qianfan.consts import Consts, DefaultLLMModel, DefaultValue
 from qianfan.resources.llm.base import (
@@ -37,14 +42,1065 @@ from qianfan.resources.llm.base import (
 from qianfan.resources.llm.function import Function
 from qianfan.resources.tools.tokenizer import Tokenizer
 from qianfan.resources.typing import JsonBody, QfLLMInfo, QfMessages, QfResponse, QfRole
+from qianfan.utils import utils
 from qianfan.utils.logging import log_error, log_info, log_warn
 
 
+@lru_cache(maxsize=1)
+def _function_model_infos() -> Dict[str, QfLLMInfo]:
+    """
+    cached lowercase model info list of Function
+
+    `Function._supported_models()` is a static preset list, so the
+    lookup table used to decide whether a request should be dispatched
+    to `qianfan.Function` only needs to be built once.
+    """
+    return {k.lower(): v for k, v in Function._supported_models().items()}
+
+
+# preset model services list of ChatCompletion
+# the dict is built once at import time so that the hot path does not
+# reconstruct model infos on every call
+_SUPPORTED_MODELS: Dict[str, QfLLMInfo] = {
+    "ERNIE-4.0-8K-Latest": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-8k-latest",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "disable_search",
+            "enable_citation",
+            "enable_trace",
+            "max_output_tokens",
+            "response_format",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-8K-0613": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-8k-0613",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "disable_search",
+            "enable_citation",
+            "enable_trace",
+            "max_output_tokens",
+            "response_format",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-Turbo-8K": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-turbo-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "disable_search",
+            "enable_citation",
+            "enable_trace",
+            "max_output_tokens",
+            "response_format",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-Lite-AppBuilder-8K-0614": QfLLMInfo(
+        endpoint="/chat/ai_apaas_lite",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "system",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-3.5-8K-0701": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-8k-0701",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "disable_search",
+            "enable_citation",
+            "enable_trace",
+            "max_output_tokens",
+            "response_format",
+            "functions",
+            "tool_choice",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-3.5-8K-0613": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-8k-0613",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "disable_search",
+            "enable_citation",
+            "enable_trace",
+            "max_output_tokens",
+            "response_format",
+            "functions",
+            "tool_choice",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.012,
+        output_price_per_1k_tokens=0.012,
+    ),
+    "ERNIE-Lite-8K-0922": QfLLMInfo(
+        endpoint="/chat/eb-instant",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "system",
+            "stop",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.008,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-Lite-8K-0308": QfLLMInfo(
+        endpoint="/chat/ernie-lite-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.003,
+        output_price_per_1k_tokens=0.006,
+    ),
+    "ERNIE-Lite-V": QfLLMInfo(
+        endpoint="/chat/ernie-lite-v",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "system",
+            "stop",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.003,
+        output_price_per_1k_tokens=0.006,
+    ),
+    "ERNIE-3.5-8K": QfLLMInfo(
+        endpoint="/chat/completions",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "user_setting",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "max_output_tokens",
+            "response_format",
+            "tool_choice",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.012,
+        output_price_per_1k_tokens=0.012,
+    ),
+    "ERNIE-4.0-8K": QfLLMInfo(
+        endpoint="/chat/completions_pro",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "response_format",
+            "max_output_tokens",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-8K-0329": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-8k-0329",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "response_format",
+            "max_output_tokens",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-8K-0104": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-8k-0104",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "response_format",
+            "max_output_tokens",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-8K-Preview-0518": QfLLMInfo(
+        endpoint="/chat/completions_adv_pro",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "response_format",
+            "max_output_tokens",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-4.0-8K-preview": QfLLMInfo(
+        endpoint="/chat/ernie-4.0-8k-preview",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "response_format",
+            "max_output_tokens",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.12,
+        output_price_per_1k_tokens=0.12,
+    ),
+    "ERNIE-3.5-128K": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-128k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "user_setting",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "max_output_tokens",
+            "response_format",
+            "tool_choice",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=516096,
+        max_input_tokens=126976,
+        input_price_per_1k_tokens=0.012,
+        output_price_per_1k_tokens=0.012,
+    ),
+    "ERNIE-3.5-8K-preview": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-8k-preview",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "user_setting",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "max_output_tokens",
+            "response_format",
+            "tool_choice",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.024,
+        output_price_per_1k_tokens=0.048,
+    ),
+    "ERNIE-3.5-8K-0205": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-8k-0205",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "user_setting",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "max_output_tokens",
+            "response_format",
+            "tool_choice",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=20000,
+        max_input_tokens=5120,
+        input_price_per_1k_tokens=0.024,
+        output_price_per_1k_tokens=0.048,
+    ),
+    "ERNIE-3.5-8K-0329": QfLLMInfo(
+        endpoint="/chat/ernie-3.5-8k-0329",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "functions",
+            "system",
+            "user_id",
+            "user_setting",
+            "stop",
+            "disable_search",
+            "enable_citation",
+            "max_output_tokens",
+            "response_format",
+            "tool_choice",
+            "enable_trace",
+            "enable_system_memory",
+            "system_memory_id",
+        },
+        max_input_chars=8000,
+        max_input_tokens=2048,
+        input_price_per_1k_tokens=0.012,
+        output_price_per_1k_tokens=0.012,
+    ),
+    "ERNIE-Speed-8K": QfLLMInfo(
+        endpoint="/chat/ernie_speed",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "system",
+            "stop",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-Speed-128K": QfLLMInfo(
+        endpoint="/chat/ernie-speed-128k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "system",
+            "stop",
+            "max_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=507904,
+        max_input_tokens=126976,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE Speed-AppBuilder": QfLLMInfo(
+        endpoint="/chat/ai_apaas",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "system",
+            "user_id",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=11200,
+        max_input_tokens=7168,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-Tiny-8K": QfLLMInfo(
+        endpoint="/chat/ernie-tiny-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "system",
+            "stop",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=24000,
+        max_input_tokens=6144,
+        input_price_per_1k_tokens=0.001,
+        output_price_per_1k_tokens=0.001,
+    ),
+    "ERNIE-Novel-8K": QfLLMInfo(
+        endpoint="/chat/ernie-novel-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "user_id",
+            "tools",
+            "tool_choice",
+            "system",
+            "stop",
+            "enable_system_memory",
+            "system_memory_id",
+            "max_output_tokens",
+            "min_output_tokens",
+            "frequency_penalty",
+            "presence_penalty",
+        },
+        max_input_chars=24000,
+        max_input_tokens=6144,
+        input_price_per_1k_tokens=0.001,
+        output_price_per_1k_tokens=0.001,
+    ),
+    "ERNIE-Function-8K": QfLLMInfo(
+        endpoint="/chat/ernie-func-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "system",
+            "user_id",
+            "stop",
+            "max_output_tokens",
+        },
+        max_input_chars=24000,
+        max_input_tokens=6144,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-Character-8K": QfLLMInfo(
+        endpoint="/chat/ernie-char-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "system",
+            "user_id",
+            "stop",
+            "max_output_tokens",
+        },
+        max_input_chars=24000,
+        max_input_tokens=6144,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "ERNIE-Character-Fiction-8K": QfLLMInfo(
+        endpoint="/chat/ernie-char-fiction-8k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "temperature",
+            "top_p",
+            "penalty_score",
+            "system",
+            "user_id",
+            "stop",
+            "max_output_tokens",
+        },
+        max_input_chars=24000,
+        max_input_tokens=6144,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "BLOOMZ-7B": QfLLMInfo(
+        endpoint="/chat/bloomz_7b1",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "Llama-2-7B-Chat": QfLLMInfo(
+        endpoint="/chat/llama_2_7b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "Llama-2-13B-Chat": QfLLMInfo(
+        endpoint="/chat/llama_2_13b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.006,
+        output_price_per_1k_tokens=0.006,
+    ),
+    "Llama-2-70B-Chat": QfLLMInfo(
+        endpoint="/chat/llama_2_70b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.035,
+        output_price_per_1k_tokens=0.035,
+    ),
+    "Meta-Llama-3-8B": QfLLMInfo(
+        endpoint="/chat/llama_3_8b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "Meta-Llama-3-70B": QfLLMInfo(
+        endpoint="/chat/llama_3_70b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.035,
+        output_price_per_1k_tokens=0.035,
+    ),
+    "Qianfan-BLOOMZ-7B-compressed": QfLLMInfo(
+        endpoint="/chat/qianfan_bloomz_7b_compressed",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "Qianfan-Chinese-Llama-2-7B": QfLLMInfo(
+        endpoint="/chat/qianfan_chinese_llama_2_7b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "ChatGLM2-6B-32K": QfLLMInfo(
+        endpoint="/chat/chatglm2_6b_32k",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "AquilaChat-7B": QfLLMInfo(
+        endpoint="/chat/aquilachat_7b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    "XuanYuan-70B-Chat-4bit": QfLLMInfo(
+        endpoint="/chat/xuanyuan_70b_chat",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.035,
+        output_price_per_1k_tokens=0.035,
+    ),
+    "Qianfan-Chinese-Llama-2-13B": QfLLMInfo(
+        endpoint="/chat/qianfan_chinese_llama_2_13b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.006,
+        output_price_per_1k_tokens=0.006,
+    ),
+    "Qianfan-Chinese-Llama-2-70B": QfLLMInfo(
+        endpoint="/chat/qianfan_chinese_llama_2_70b",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.006,
+        output_price_per_1k_tokens=0.006,
+    ),
+    "ChatLaw": QfLLMInfo(
+        endpoint="/chat/chatlaw",
+        required_keys={"messages", "extra_parameters"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_p",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.008,
+        output_price_per_1k_tokens=0.008,
+    ),
+    "Yi-34B-Chat": QfLLMInfo(
+        endpoint="/chat/yi_34b_chat",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        # 限时免费
+        input_price_per_1k_tokens=0,
+        output_price_per_1k_tokens=0,
+    ),
+    "Mixtral-8x7B-Instruct": QfLLMInfo(
+        endpoint="/chat/mixtral_8x7b_instruct",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.035,
+        output_price_per_1k_tokens=0.035,
+    ),
+    "Gemma-7B-it": QfLLMInfo(
+        endpoint="/chat/gemma_7b_it",
+        required_keys={"messages"},
+        optional_keys={
+            "stream",
+            "user_id",
+            "temperature",
+            "top_k",
+            "top_p",
+            "penalty_score",
+            "stop",
+            "tools",
+            "tool_choice",
+        },
+        max_input_chars=4800,
+        max_input_tokens=None,
+        input_price_per_1k_tokens=0.004,
+        output_price_per_1k_tokens=0.004,
+    ),
+    UNSPECIFIED_MODEL: QfLLMInfo(
+        endpoint="",
+        required_keys={"messages"},
+        optional_keys=set(),
+    ),
+}
+
+# 模型别名，与被指向的模型使用同一份模型信息
+# aliases are resolved in `_supported_models` after the runtime model
+# merge so that they track dynamically updated endpoints
+_MODEL_ALIAS = {
+    "ERNIE-Speed": "ERNIE-Speed-8K",
+    "ERNIE Speed": "ERNIE-Speed-8K",
+    "ERNIE 3.5": "ERNIE-3.5-8K",
+    "ERNIE-Lite-8K": "ERNIE-Lite-8K-0308",
+    "ERNIE-4.0-preview": "ERNIE-4.0-8K-preview",
+    "ERNIE-3.5-preview": "ERNIE-3.5-8K-preview",
+    "ERNIE-Functions-8K": "ERNIE-Function-8K",
+}
+
+_DEPRECATED_MODEL_ALIAS = {
+    "ERNIE-Bot-4": "ERNIE-4.0-8K",
+    "ERNIE-Bot": "ERNIE-3.5-8K",
+    "ERNIE-Bot-turbo": "ERNIE-Lite-8K-0922",
+    "EB-turbo-AppBuilder": "ERNIE Speed-AppBuilder",
+    "ERNIE-Bot-turbo-AI": "ERNIE Speed-AppBuilder",
+}
+
+
 class _ChatCompletionV1(BaseResourceV1):
     """
     QianFan ChatCompletion is an agent for calling QianFan ChatCompletion API.
     """
 
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        enable_response_cache: bool = False,
+        response_cache_size: int = DefaultValue.ResponseCacheSize,
+        response_cache_ttl: float = DefaultValue.ResponseCacheTTL,
+        **kwargs: Any,
+    ) -> None:
+        """
+        init ChatCompletion
+
+        Args:
+            model (Optional[str]):
+                the name of the model used by default
+            endpoint (Optional[str]):
+                the endpoint used by default
+            enable_response_cache (bool):
+                whether to cache non-stream responses in memory, keyed by
+                the request content, so that identical requests skip the
+                network round trip. Default to False.
+            response_cache_size (int):
+                max entry count of the response cache
+            response_cache_ttl (float):
+                time-to-live of cached responses in seconds
+        """
+        super().__init__(model=model, endpoint=endpoint, **kwargs)
+        self._response_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=response_cache_size, ttl=response_cache_ttl)
+            if enable_response_cache
+            else None
+        )
+        self._response_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _response_cache_key(
+        model: Optional[str], endpoint: Optional[str], kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        generate the response cache key of one request
+
+        the key is the truncated SHA-256 of the canonicalized request
+        content; `request_id` varies per call and is excluded
+        """
+        content = {
+            "model": model,
+            "endpoint": endpoint,
+            "body": {k: v for k, v in kwargs.items() if k != "request_id"},
+        }
+        canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
     @classmethod
     def _supported_models(cls) -> Dict[str, QfLLMInfo]:
         """
@@ -57,1004 +1113,28 @@ class _ChatCompletionV1(BaseResourceV1):
             a dict which key is preset model and value is the endpoint
 
         """
-        info_list = {
-            "ERNIE-4.0-8K-Latest": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-8k-latest",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "disable_search",
-                    "enable_citation",
-                    "enable_trace",
-                    "max_output_tokens",
-                    "response_format",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-8K-0613": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-8k-0613",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "disable_search",
-                    "enable_citation",
-                    "enable_trace",
-                    "max_output_tokens",
-                    "response_format",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-Turbo-8K": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-turbo-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "disable_search",
-                    "enable_citation",
-                    "enable_trace",
-                    "max_output_tokens",
-                    "response_format",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-Lite-AppBuilder-8K-0614": QfLLMInfo(
-                endpoint="/chat/ai_apaas_lite",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "system",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-3.5-8K-0701": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-8k-0701",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "disable_search",
-                    "enable_citation",
-                    "enable_trace",
-                    "max_output_tokens",
-                    "response_format",
-                    "functions",
-                    "tool_choice",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-3.5-8K-0613": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-8k-0613",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "disable_search",
-                    "enable_citation",
-                    "enable_trace",
-                    "max_output_tokens",
-                    "response_format",
-                    "functions",
-                    "tool_choice",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.012,
-                output_price_per_1k_tokens=0.012,
-            ),
-            "ERNIE-Lite-8K-0922": QfLLMInfo(
-                endpoint="/chat/eb-instant",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "system",
-                    "stop",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.008,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-Lite-8K-0308": QfLLMInfo(
-                endpoint="/chat/ernie-lite-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.003,
-                output_price_per_1k_tokens=0.006,
-            ),
-            "ERNIE-Lite-V": QfLLMInfo(
-                endpoint="/chat/ernie-lite-v",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "system",
-                    "stop",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.003,
-                output_price_per_1k_tokens=0.006,
-            ),
-            "ERNIE-3.5-8K": QfLLMInfo(
-                endpoint="/chat/completions",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "user_setting",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "max_output_tokens",
-                    "response_format",
-                    "tool_choice",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.012,
-                output_price_per_1k_tokens=0.012,
-            ),
-            "ERNIE-4.0-8K": QfLLMInfo(
-                endpoint="/chat/completions_pro",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "response_format",
-                    "max_output_tokens",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-8K-0329": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-8k-0329",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "response_format",
-                    "max_output_tokens",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-8K-0104": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-8k-0104",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "response_format",
-                    "max_output_tokens",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-8K-Preview-0518": QfLLMInfo(
-                endpoint="/chat/completions_adv_pro",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "response_format",
-                    "max_output_tokens",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-4.0-8K-preview": QfLLMInfo(
-                endpoint="/chat/ernie-4.0-8k-preview",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "response_format",
-                    "max_output_tokens",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.12,
-                output_price_per_1k_tokens=0.12,
-            ),
-            "ERNIE-3.5-128K": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-128k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "user_setting",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "max_output_tokens",
-                    "response_format",
-                    "tool_choice",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=516096,
-                max_input_tokens=126976,
-                input_price_per_1k_tokens=0.012,
-                output_price_per_1k_tokens=0.012,
-            ),
-            "ERNIE-3.5-8K-preview": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-8k-preview",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "user_setting",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "max_output_tokens",
-                    "response_format",
-                    "tool_choice",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.024,
-                output_price_per_1k_tokens=0.048,
-            ),
-            "ERNIE-3.5-8K-0205": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-8k-0205",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "user_setting",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "max_output_tokens",
-                    "response_format",
-                    "tool_choice",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=20000,
-                max_input_tokens=5120,
-                input_price_per_1k_tokens=0.024,
-                output_price_per_1k_tokens=0.048,
-            ),
-            "ERNIE-3.5-8K-0329": QfLLMInfo(
-                endpoint="/chat/ernie-3.5-8k-0329",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "functions",
-                    "system",
-                    "user_id",
-                    "user_setting",
-                    "stop",
-                    "disable_search",
-                    "enable_citation",
-                    "max_output_tokens",
-                    "response_format",
-                    "tool_choice",
-                    "enable_trace",
-                    "enable_system_memory",
-                    "system_memory_id",
-                },
-                max_input_chars=8000,
-                max_input_tokens=2048,
-                input_price_per_1k_tokens=0.012,
-                output_price_per_1k_tokens=0.012,
-            ),
-            "ERNIE-Speed-8K": QfLLMInfo(
-                endpoint="/chat/ernie_speed",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "system",
-                    "stop",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-Speed-128K": QfLLMInfo(
-                endpoint="/chat/ernie-speed-128k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "system",
-                    "stop",
-                    "max_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=507904,
-                max_input_tokens=126976,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE Speed-AppBuilder": QfLLMInfo(
-                endpoint="/chat/ai_apaas",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "system",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=11200,
-                max_input_tokens=7168,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-Tiny-8K": QfLLMInfo(
-                endpoint="/chat/ernie-tiny-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "system",
-                    "stop",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=24000,
-                max_input_tokens=6144,
-                input_price_per_1k_tokens=0.001,
-                output_price_per_1k_tokens=0.001,
-            ),
-            "ERNIE-Novel-8K": QfLLMInfo(
-                endpoint="/chat/ernie-novel-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "user_id",
-                    "tools",
-                    "tool_choice",
-                    "system",
-                    "stop",
-                    "enable_system_memory",
-                    "system_memory_id",
-                    "max_output_tokens",
-                    "min_output_tokens",
-                    "frequency_penalty",
-                    "presence_penalty",
-                },
-                max_input_chars=24000,
-                max_input_tokens=6144,
-                input_price_per_1k_tokens=0.001,
-                output_price_per_1k_tokens=0.001,
-            ),
-            "ERNIE-Function-8K": QfLLMInfo(
-                endpoint="/chat/ernie-func-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "max_output_tokens",
-                },
-                max_input_chars=24000,
-                max_input_tokens=6144,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-Character-8K": QfLLMInfo(
-                endpoint="/chat/ernie-char-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "max_output_tokens",
-                },
-                max_input_chars=24000,
-                max_input_tokens=6144,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "ERNIE-Character-Fiction-8K": QfLLMInfo(
-                endpoint="/chat/ernie-char-fiction-8k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "temperature",
-                    "top_p",
-                    "penalty_score",
-                    "system",
-                    "user_id",
-                    "stop",
-                    "max_output_tokens",
-                },
-                max_input_chars=24000,
-                max_input_tokens=6144,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "BLOOMZ-7B": QfLLMInfo(
-                endpoint="/chat/bloomz_7b1",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "Llama-2-7B-Chat": QfLLMInfo(
-                endpoint="/chat/llama_2_7b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "Llama-2-13B-Chat": QfLLMInfo(
-                endpoint="/chat/llama_2_13b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.006,
-                output_price_per_1k_tokens=0.006,
-            ),
-            "Llama-2-70B-Chat": QfLLMInfo(
-                endpoint="/chat/llama_2_70b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.035,
-                output_price_per_1k_tokens=0.035,
-            ),
-            "Meta-Llama-3-8B": QfLLMInfo(
-                endpoint="/chat/llama_3_8b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "Meta-Llama-3-70B": QfLLMInfo(
-                endpoint="/chat/llama_3_70b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.035,
-                output_price_per_1k_tokens=0.035,
-            ),
-            "Qianfan-BLOOMZ-7B-compressed": QfLLMInfo(
-                endpoint="/chat/qianfan_bloomz_7b_compressed",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "Qianfan-Chinese-Llama-2-7B": QfLLMInfo(
-                endpoint="/chat/qianfan_chinese_llama_2_7b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "ChatGLM2-6B-32K": QfLLMInfo(
-                endpoint="/chat/chatglm2_6b_32k",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "AquilaChat-7B": QfLLMInfo(
-                endpoint="/chat/aquilachat_7b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            "XuanYuan-70B-Chat-4bit": QfLLMInfo(
-                endpoint="/chat/xuanyuan_70b_chat",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.035,
-                output_price_per_1k_tokens=0.035,
-            ),
-            "Qianfan-Chinese-Llama-2-13B": QfLLMInfo(
-                endpoint="/chat/qianfan_chinese_llama_2_13b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.006,
-                output_price_per_1k_tokens=0.006,
-            ),
-            "Qianfan-Chinese-Llama-2-70B": QfLLMInfo(
-                endpoint="/chat/qianfan_chinese_llama_2_70b",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.006,
-                output_price_per_1k_tokens=0.006,
-            ),
-            "ChatLaw": QfLLMInfo(
-                endpoint="/chat/chatlaw",
-                required_keys={"messages", "extra_parameters"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_p",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.008,
-                output_price_per_1k_tokens=0.008,
-            ),
-            "Yi-34B-Chat": QfLLMInfo(
-                endpoint="/chat/yi_34b_chat",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                # 限时免费
-                input_price_per_1k_tokens=0,
-                output_price_per_1k_tokens=0,
-            ),
-            "Mixtral-8x7B-Instruct": QfLLMInfo(
-                endpoint="/chat/mixtral_8x7b_instruct",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.035,
-                output_price_per_1k_tokens=0.035,
-            ),
-            "Gemma-7B-it": QfLLMInfo(
-                endpoint="/chat/gemma_7b_it",
-                required_keys={"messages"},
-                optional_keys={
-                    "stream",
-                    "user_id",
-                    "temperature",
-                    "top_k",
-                    "top_p",
-                    "penalty_score",
-                    "stop",
-                    "tools",
-                    "tool_choice",
-                },
-                max_input_chars=4800,
-                max_input_tokens=None,
-                input_price_per_1k_tokens=0.004,
-                output_price_per_1k_tokens=0.004,
-            ),
-            UNSPECIFIED_MODEL: QfLLMInfo(
-                endpoint="",
-                required_keys={"messages"},
-                optional_keys=set(),
-            ),
-        }
         # 获取最新的模型列表
         latest_models_list = super()._supported_models()
-        for m in latest_models_list:
-            if m not in info_list:
-                info_list[m] = latest_models_list[m]
-            else:
-                # 更新endpoint
-                info_list[m].endpoint = latest_models_list[m].endpoint
-        alias = {
-            "ERNIE-Speed": "ERNIE-Speed-8K",
-            "ERNIE Speed": "ERNIE-Speed-8K",
-            "ERNIE 3.5": "ERNIE-3.5-8K",
-            "ERNIE-Lite-8K": "ERNIE-Lite-8K-0308",
-            "ERNIE-4.0-preview": "ERNIE-4.0-8K-preview",
-            "ERNIE-3.5-preview": "ERNIE-3.5-8K-preview",
-            "ERNIE-Functions-8K": "ERNIE-Function-8K",
-        }
-        for src, target in alias.items():
-            info_list[src] = info_list[target]
-
-        deprecated_alias = {
-            "ERNIE-Bot-4": "ERNIE-4.0-8K",
-            "ERNIE-Bot": "ERNIE-3.5-8K",
-            "ERNIE-Bot-turbo": "ERNIE-Lite-8K-0922",
-            "EB-turbo-AppBuilder": "ERNIE Speed-AppBuilder",
-            "ERNIE-Bot-turbo-AI": "ERNIE Speed-AppBuilder",
-        }
-
-        # for m in info_list:
-        #     if m not in latest_models_list.keys():
-        #         info_list[m].deprecated = True
-
-        for src, target in deprecated_alias.items():
-            info = copy.deepcopy(info_list[target])
+        # build a fresh merged view instead of mutating the shared
+        # preset dict, so concurrent callers never observe it resizing
+        merged = dict(_SUPPORTED_MODELS)
+        for m, latest_info in latest_models_list.items():
+            if m not in merged:
+                merged[m] = latest_info
+            elif merged[m].endpoint != latest_info.endpoint:
+                # 更新endpoint，复制一份避免修改共享的预置模型信息
+                info = copy.copy(merged[m])
+                info.endpoint = latest_info.endpoint
+                merged[m] = info
+        # aliases are derived after the merge so they follow endpoint
+        # updates of their targets
+        for src, target in _MODEL_ALIAS.items():
+            merged[src] = merged[target]
+        for src, target in _DEPRECATED_MODEL_ALIAS.items():
+            info = copy.deepcopy(merged[target])
             info.deprecated = True
-            info_list[src] = info
-
-        return info_list
+            merged[src] = info
+        return merged
 
     @classmethod
     def api_type(cls) -> str:
@@ -1143,8 +1223,27 @@ class _ChatCompletionV1(BaseResourceV1):
 
         if request_id is not None:
             kwargs["request_id"] = request_id
+        elif auto_concat_truncate:
+            # keep a stable request id across continuation rounds so that
+            # gateways which cache the prompt prefix can correlate the
+            # rounds of one conversation
+            kwargs["request_id"] = (
+                f"{Consts.QianfanRequestIdDefaultPrefix}-"
+                f"{utils.generate_letter_num_random_id(16)}"
+            )
         kwargs["_auto_truncate"] = truncate_overlong_msgs
 
+        # truncated conversations depend on the previous replies,
+        # so only plain non-stream requests are cacheable
+        cache_key: Optional[str] = None
+        response_cache = self._response_cache
+        if response_cache is not None and not stream and not auto_concat_truncate:
+            cache_key = self._response_cache_key(model, endpoint, kwargs)
+            with self._response_cache_lock:
+                cached_resp = response_cache.get(cache_key)
+            if cached_resp is not None:
+                return copy.deepcopy(cached_resp)
+
         resp = self._do(
             model,
             stream,
@@ -1154,6 +1253,13 @@ class _ChatCompletionV1(BaseResourceV1):
             endpoint=endpoint,
             **kwargs,
         )
+        if (
+            response_cache is not None
+            and cache_key is not None
+            and isinstance(resp, QfResponse)
+        ):
+            with self._response_cache_lock:
+                response_cache[cache_key] = copy.deepcopy(resp)
         if not auto_concat_truncate:
             return resp
         # continuously request for entire reply
@@ -1161,7 +1267,6 @@ class _ChatCompletionV1(BaseResourceV1):
             assert isinstance(resp, Iterator)
             return self._stream_concat_truncated(
                 resp,
-                kwargs.pop("messages"),
                 model,
                 endpoint,
                 retry_count,
@@ -1174,14 +1279,14 @@ class _ChatCompletionV1(BaseResourceV1):
         cur_content: str = resp["result"]
         entire_content: str = cur_content
         is_truncated: bool = resp["is_truncated"]
-        msgs = copy.deepcopy(messages)
+        # the loop below only appends new messages, so a shallow copy
+        # of the message list is enough here
+        msgs: List[Dict] = list(kwargs["messages"])
+        # the continue prompt never changes, so build its message dict once;
+        # message dicts are never mutated in place, so sharing it is safe
+        continue_msg = {"content": truncated_continue_prompt, "role": "user"}
         while is_truncated:
-            if isinstance(msgs, QfMessages):
-                msgs.append(cur_content, QfRole.Assistant)
-                msgs.append(truncated_continue_prompt, QfRole.User)
-            else:
-                msgs.append({"content": cur_content, "role": "assistant"})
-                msgs.append({"content": truncated_continue_prompt, "role": "user"})
+            self._append_continuation(msgs, cur_content, continue_msg)
             cur_content = ""
             kwargs["messages"] = msgs
             resp = self._do(
@@ -1202,10 +1307,56 @@ class _ChatCompletionV1(BaseResourceV1):
                 return resp
         return resp
 
+    @staticmethod
+    def _append_continuation(
+        msgs: List[Dict], cur_content: str, continue_msg: Dict[str, str]
+    ) -> None:
+        """
+        append the truncated partial reply and the continue prompt so the
+        next round picks up where the previous reply stopped
+        """
+        msgs.append({"content": cur_content, "role": "assistant"})
+        msgs.append(continue_msg)
+
+    @staticmethod
+    def _accumulate_chunk(body: Dict[str, Any], parts: List[str]) -> bool:
+        """
+        collect the content of one stream chunk and report whether the
+        reply is still truncated
+        """
+        parts.append(body["result"])
+        return body.get("is_truncated", False)
+
+    @staticmethod
+    def _continuation_appender(
+        messages: Union[List[Dict], QfMessages],
+        truncated_continue_prompt: str,
+    ) -> Callable[[str], None]:
+        """
+        bind an appender which adds the truncated reply and the continue
+        prompt to `messages` in the style matching the message type
+        """
+        if isinstance(messages, QfMessages):
+
+            def append_continuation(content: str) -> None:
+                messages.append(content, QfRole.Assistant)
+                messages.append(truncated_continue_prompt, QfRole.User)
+
+        else:
+            # the continue prompt never changes, so build its message dict
+            # once; message dicts are never mutated in place, so the shared
+            # dict is safe to append on every round
+            continue_msg = {"content": truncated_continue_prompt, "role": "user"}
+
+            def append_continuation(content: str) -> None:
+                messages.append({"content": content, "role": "assistant"})
+                messages.append(continue_msg)
+
+        return append_continuation
+
     def _stream_concat_truncated(
         self,
         first_resp: Iterator[QfResponse],
-        messages: Union[List[Dict], QfMessages],
         model: Optional[str] = None,
         endpoint: Optional[str] = None,
         retry_count: int = DefaultValue.RetryCount,
@@ -1242,20 +1393,29 @@ class _ChatCompletionV1(BaseResourceV1):
         Yields:
             Iterator[QfResponse]: _description_
         """
-        cur_content: str = ""
+        # accumulate chunks in a list and join once per round to avoid
+        # quadratic str concatenation on long replies
+        parts: List[str] = []
+        is_truncated: bool = False
         for r in first_resp:
-            cur_content += r["result"]
+            is_truncated = self._accumulate_chunk(r.body, parts)
             yield r
-        is_truncated: bool = True
+        if not is_truncated:
+            # common case: the reply was complete, no continuation needed
+            return
+        # `messages` stays in kwargs: the appender mutates the list in
+        # place, so each round's request body picks up the new messages
+        # without re-assigning the key
+        messages = kwargs["messages"]
+        # the type of `messages` never changes, so dispatch the append
+        # style once instead of testing it on every round
+        append_continuation = self._continuation_appender(
+            messages, truncated_continue_prompt
+        )
         while is_truncated:
-            if isinstance(messages, QfMessages):
-                messages.append(cur_content, QfRole.Assistant)
-                messages.append(truncated_continue_prompt, QfRole.User)
-            else:
-                messages.append({"content": cur_content, "role": "assistant"})
-                messages.append({"content": truncated_continue_prompt, "role": "user"})
-            cur_content = ""
-            kwargs["messages"] = messages
+            cur_content = "".join(parts)
+            parts.clear()
+            append_continuation(cur_content)
             resp = self._do(
                 model,
                 True,
@@ -1267,8 +1427,7 @@ class _ChatCompletionV1(BaseResourceV1):
             )
 
             for r in resp:
-                cur_content += r["result"]
-                is_truncated = r["is_truncated"]
+                is_truncated = self._accumulate_chunk(r.body, parts)
                 # if r["is_end"] and not is_truncated:
                 #     r.body["is_end"] = False
                 yield r
@@ -1343,8 +1502,27 @@ class _ChatCompletionV1(BaseResourceV1):
 
         if request_id is not None:
             kwargs["request_id"] = request_id
+        elif auto_concat_truncate:
+            # keep a stable request id across continuation rounds so that
+            # gateways which cache the prompt prefix can correlate the
+            # rounds of one conversation
+            kwargs["request_id"] = (
+                f"{Consts.QianfanRequestIdDefaultPrefix}-"
+                f"{utils.generate_letter_num_random_id(16)}"
+            )
         kwargs["_auto_truncate"] = truncate_overlong_msgs
 
+        # truncated conversations depend on the previous replies,
+        # so only plain non-stream requests are cacheable
+        cache_key: Optional[str] = None
+        response_cache = self._response_cache
+        if response_cache is not None and not stream and not auto_concat_truncate:
+            cache_key = self._response_cache_key(model, endpoint, kwargs)
+            with self._response_cache_lock:
+                cached_resp = response_cache.get(cache_key)
+            if cached_resp is not None:
+                return copy.deepcopy(cached_resp)
+
         resp = await self._ado(
             model,
             stream,
@@ -1354,13 +1532,19 @@ class _ChatCompletionV1(BaseResourceV1):
             endpoint=endpoint,
             **kwargs,
         )
+        if (
+            response_cache is not None
+            and cache_key is not None
+            and isinstance(resp, QfResponse)
+        ):
+            with self._response_cache_lock:
+                response_cache[cache_key] = copy.deepcopy(resp)
         if not auto_concat_truncate:
             return resp
         if stream:
             assert isinstance(resp, AsyncIterator)
             return self._async_stream_concat_truncated(
                 resp,
-                kwargs.pop("messages"),
                 model,
                 endpoint,
                 retry_count,
@@ -1374,14 +1558,14 @@ class _ChatCompletionV1(BaseResourceV1):
         entire_content: str = cur_content
         is_truncated: bool = resp["is_truncated"]
 
-        msgs = copy.deepcopy(messages)
+        # the loop below only appends new messages, so a shallow copy
+        # of the message list is enough here
+        msgs: List[Dict] = list(kwargs["messages"])
+        # the continue prompt never changes, so build its message dict once;
+        # message dicts are never mutated in place, so sharing it is safe
+        continue_msg = {"content": truncated_continue_prompt, "role": "user"}
         while is_truncated:
-            if isinstance(msgs, QfMessages):
-                msgs.append(cur_content, QfRole.Assistant)
-                msgs.append(truncated_continue_prompt, QfRole.User)
-            else:
-                msgs.append({"content": cur_content, "role": "assistant"})
-                msgs.append({"content": truncated_continue_prompt, "role": "user"})
+            self._append_continuation(msgs, cur_content, continue_msg)
             cur_content = ""
             kwargs["messages"] = msgs
             resp = await self._ado(
@@ -1405,7 +1589,6 @@ class _ChatCompletionV1(BaseResourceV1):
     async def _async_stream_concat_truncated(
         self,
         first_resp: AsyncIterator[QfResponse],
-        messages: Union[List[Dict], QfMessages],
         model: Optional[str] = None,
         endpoint: Optional[str] = None,
         retry_count: int = DefaultValue.RetryCount,
@@ -1417,20 +1600,29 @@ class _ChatCompletionV1(BaseResourceV1):
         """
         Stream concat.
         """
-        cur_content: str = ""
+        # accumulate chunks in a list and join once per round to avoid
+        # quadratic str concatenation on long replies
+        parts: List[str] = []
+        is_truncated: bool = False
         async for r in first_resp:
-            cur_content += r["result"]
+            is_truncated = self._accumulate_chunk(r.body, parts)
             yield r
-        is_truncated: bool = True
+        if not is_truncated:
+            # common case: the reply was complete, no continuation needed
+            return
+        # `messages` stays in kwargs: the appender mutates the list in
+        # place, so each round's request body picks up the new messages
+        # without re-assigning the key
+        messages = kwargs["messages"]
+        # the type of `messages` never changes, so dispatch the append
+        # style once instead of testing it on every round
+        append_continuation = self._continuation_appender(
+            messages, truncated_continue_prompt
+        )
         while is_truncated:
-            if isinstance(messages, QfMessages):
-                messages.append(cur_content, QfRole.Assistant)
-                messages.append(truncated_continue_prompt, QfRole.User)
-            else:
-                messages.append({"content": cur_content, "role": "assistant"})
-                messages.append({"content": truncated_continue_prompt, "role": "user"})
-            cur_content = ""
-            kwargs["messages"] = messages
+            cur_content = "".join(parts)
+            parts.clear()
+            append_continuation(cur_content)
 
             resp = await self._ado(
                 model,
@@ -1443,8 +1635,7 @@ class _ChatCompletionV1(BaseResourceV1):
             )
             assert isinstance(resp, AsyncIterator)
             async for r in resp:
-                cur_content += r["result"]
-                is_truncated = r["is_truncated"]
+                is_truncated = self._accumulate_chunk(r.body, parts)
                 yield r
 
     def _generate_body(
@@ -1616,17 +1807,19 @@ class ChatCompletion(VersionBase):
             return Function
         else:
             model = kwargs.get("model") or ""
-            func_model_info_list = {
-                k.lower(): v for k, v in Function._supported_models().items()
-            }
-            func_model_info = func_model_info_list.get(model.lower())
-            if model and func_model_info:
-                if func_model_info and func_model_info.endpoint:
-                    return Function
-            endpoint = kwargs.get("endpoint", "")
-            for m in func_model_info_list.values():
-                if endpoint and m.endpoint == endpoint:
-                    return Function
+            endpoint = kwargs.get("endpoint") or ""
+            # the default call path passes neither model nor endpoint,
+            # so skip the function-model scan entirely in that case
+            if model or endpoint:
+                func_model_info_list = _function_model_infos()
+                if model:
+                    func_model_info = func_model_info_list.get(model.lower())
+                    if func_model_info and func_model_info.endpoint:
+                        return Function
+                if endpoint:
+                    for m in func_model_info_list.values():
+                        if m.endpoint == endpoint:
+                            return Function
 
         if version == "1":
             return _ChatCompletionV1
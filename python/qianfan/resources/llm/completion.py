@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from functools import partial
 from typing import (
     Any,
@@ -102,7 +103,10 @@ class Completion(BaseResourceV1):
         chat_model_info = _ChatCompletionV1._supported_models()
         for model, info in chat_model_info.items():
             if model not in info_list:
-                info.required_keys.discard("messages")
+                # the model info is shared with ChatCompletion,
+                # so it should not be modified in place
+                info = copy.copy(info)
+                info.required_keys = info.required_keys - {"messages"}
                 # info.required_keys.add("prompt")
                 info_list[model] = info
         return info_list
@@ -16,6 +16,7 @@ import re
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 import qianfan.errors as errors
+from qianfan.resources.console.prompt import Prompt as PromptResource
 from qianfan.resources.llm.base import (
     UNSPECIFIED_MODEL,
     BaseResourceV1,
@@ -332,8 +333,6 @@ class Function(BaseResourceV1):
     def _render_prompt(
         self, prompt_template: str, identifier: str, **kwargs: Any
     ) -> str:
-        from qianfan.resources.console.prompt import Prompt as PromptResource
-
         variables = PromptResource._extract_variables(prompt_template, identifier)
 
         def _render(_prompt: str, _vars: List[str], **kwargs: Any) -> str:
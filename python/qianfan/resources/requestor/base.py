@@ -299,6 +299,18 @@ class BaseAPIRequestor(object):
         self._client = HTTPClient(**kwargs)
         self._rate_limiter = VersatileRateLimiter(**kwargs)
 
+    def close(self) -> None:
+        """
+        close the underlying HTTP connections
+        """
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """
+        close the async HTTP connections of the current event loop
+        """
+        await self._client.aclose()
+
     def _preprocess_request(self, request: QfRequest) -> QfRequest:
         return request
 
@@ -345,29 +357,27 @@ class BaseAPIRequestor(object):
         """
         request = self._preprocess_request(request)
         start = time.perf_counter()
-        response, session = await self._client.arequest(request)
+        response = await self._client.arequest(request)
         request_latency = time.perf_counter() - start
 
-        async with session:
-            async with response:
-                _async_check_if_status_code_is_200(response)
-                try:
-                    body = await response.json()
-                except json.JSONDecodeError:
-                    raise errors.RequestError(
-                        "Got invalid json response from server, body:"
-                        f" {response.content}"
-                    )
-                resp = await self._parse_async_response(body, response)
-                resp.statistic["request_latency"] = request_latency
-                resp.request = QfRequest.from_aiohttp(response.request_info)
-                resp.request.json_body = copy.deepcopy(request.json_body)
-                if "X-Ratelimit-Limit-Requests" in resp.headers:
-                    await self._rate_limiter.async_reset_once(
-                        float(resp.headers["X-Ratelimit-Limit-Requests"])
-                    )
+        async with response:
+            _async_check_if_status_code_is_200(response)
+            try:
+                body = await response.json()
+            except json.JSONDecodeError:
+                raise errors.RequestError(
+                    f"Got invalid json response from server, body: {response.content}"
+                )
+            resp = await self._parse_async_response(body, response)
+            resp.statistic["request_latency"] = request_latency
+            resp.request = QfRequest.from_aiohttp(response.request_info)
+            resp.request.json_body = copy.deepcopy(request.json_body)
+            if "X-Ratelimit-Limit-Requests" in resp.headers:
+                await self._rate_limiter.async_reset_once(
+                    float(resp.headers["X-Ratelimit-Limit-Requests"])
+                )
 
-                return data_postprocess(resp)
+            return data_postprocess(resp)
 
     def _parse_response(
         self, body: Dict[str, Any], resp: requests.Response
@@ -24,6 +24,11 @@ import requests
 
 from qianfan.errors import InvalidArgumentError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if sys.version_info < (3, 10):
     from typing_extensions import ParamSpec  # noqa: F401
 else:
@@ -98,14 +103,37 @@ class QfRequest:
         """
         convert self to args of requests.request() or aiohttp.requests()
         """
-        return {
+        args: Dict[str, Any] = {
             "method": self.method,
             "url": self.url,
             "params": self.query,
             "headers": self.headers,
-            "json": self.json_body,
             # "files": self.files,
         }
+        if orjson is not None:
+            # serialize the body with orjson when available, which is
+            # significantly faster than stdlib json for large payloads;
+            # the options mirror stdlib behavior for non-str dict keys
+            # and numpy scalars
+            try:
+                args["data"] = orjson.dumps(
+                    self.json_body,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            except TypeError:
+                # payloads orjson cannot handle fall back to stdlib json
+                args["json"] = self.json_body
+            else:
+                if not any(k.lower() == "content-type" for k in self.headers):
+                    # only inject the header when no case variant of it is
+                    # present, otherwise aiohttp would send both
+                    args["headers"] = {
+                        "Content-Type": "application/json",
+                        **self.headers,
+                    }
+        else:
+            args["json"] = self.json_body
+        return args
 
     @classmethod
     def from_requests(cls, req: requests.PreparedRequest) -> "QfRequest":
@@ -266,6 +294,8 @@ class QfMessages:
         Init QfMessages
         """
         self._msg_list: List[QfMessages._Message] = []
+        self._list_cache: List[Dict[str, Any]] = []
+        self._dirty: bool = True
 
     def append(
         self, message: Union[str, QfResponse], role: Optional[Union[str, QfRole]] = None
@@ -296,6 +326,7 @@ class QfMessages:
                 role = role if role is not None else QfRole.User
                 msg = QfMessages._Message(role=role, content=message)
             self._msg_list.append(msg)
+            self._dirty = True
         elif isinstance(message, QfResponse):
             try:
                 role = role if role is not None else QfRole.Assistant
@@ -303,6 +334,7 @@ class QfMessages:
                 if "function_call" in message.body:
                     msg.extra["function_call"] = message.body["function_call"]
                 self._msg_list.append(msg)
+                self._dirty = True
             except Exception:
                 raise InvalidArgumentError("response not found in QfResponse")
         else:
@@ -314,4 +346,11 @@ class QfMessages:
         """
         convert messages to list
         """
-        return [msg._to_dict() for msg in self._msg_list]
+        # converting every message on each call is O(N) in history
+        # length, so keep the converted list until an append invalidates
+        # it; hand out fresh dicts because callers mutate them in place
+        # (e.g. qianfan.Function rewrites roles and contents)
+        if self._dirty:
+            self._list_cache = [msg._to_dict() for msg in self._msg_list]
+            self._dirty = False
+        return [dict(d) for d in self._list_cache]
@@ -231,6 +231,23 @@ def test_request_id():
     assert resp.headers[Consts.XResponseID] == "custom_req"
 
 
+def test_response_cache():
+    chat_comp = qianfan.ChatCompletion(enable_response_cache=True)
+    resp1 = chat_comp.do(messages=TEST_MESSAGE)
+    # identical request should be served from the cache; the mock server
+    # echoes the request headers back, which contain a random request id,
+    # so an identical body proves no second request was sent
+    resp2 = chat_comp.do(messages=TEST_MESSAGE)
+    assert resp2.body == resp1.body
+    # different request content should miss the cache
+    resp3 = chat_comp.do(messages=TEST_MESSAGE, temperature=0.5)
+    assert resp3["_request"]["temperature"] == 0.5
+    # cached response should not alias the stored one
+    resp2.body["result"] = "modified"
+    resp4 = chat_comp.do(messages=TEST_MESSAGE)
+    assert resp4["result"] != "modified"
+
+
 @pytest.mark.asyncio
 async def test_generate_async():
     """